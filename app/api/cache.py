@@ -0,0 +1,68 @@
+from typing import Optional
+
+from cachetools import LRUCache, TTLCache
+
+from app.core.config import settings
+from app.db.redis import RedisCache
+
+_CACHE_TTL = settings.CACHE_TTL_SECONDS
+
+# L1 in front of the Redis list cache: a short TTLCache absorbs polling
+# bursts without even a Redis round trip. Keys embed an in-process
+# per-user generation bumped on every local write, so writes through
+# this instance invalidate immediately; writes on other instances are
+# bounded by the short TTL.
+LIST_L1_TTL_SECONDS = 2
+list_l1: TTLCache = TTLCache(maxsize=10_000, ttl=LIST_L1_TTL_SECONDS)
+# LRU-bounded so the per-user generations don't grow without limit in a
+# long-lived process. An evicted generation restarts at 0 for that
+# user, which is safe: any entries keyed under the old generation age
+# out of the TTLCache within LIST_L1_TTL_SECONDS anyway.
+list_l1_gen: LRUCache = LRUCache(maxsize=10_000)
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """
+    Best-effort cache read; any Redis problem is treated as a miss.
+    """
+    client = RedisCache.client
+    if not client:
+        return None
+    try:
+        return await client.get(key)
+    except Exception:
+        return None
+
+
+async def cache_set(key: str, body: bytes) -> None:
+    """
+    Best-effort cache write with the configured TTL.
+    """
+    client = RedisCache.client
+    if not client:
+        return
+    try:
+        await client.setex(key, _CACHE_TTL, body)
+    except Exception:
+        pass
+
+
+async def invalidate_job_cache(user_id: str, job_id: Optional[str] = None) -> None:
+    """
+    Invalidate the user's cached listings (by bumping their generation
+    counter, which is part of every list key) and, when given, the
+    cached single-job response.
+
+    Lives outside the route module so the service layer can call it on
+    writes the routes never see (job completion via Cloud Tasks).
+    """
+    list_l1_gen[user_id] = list_l1_gen.get(user_id, 0) + 1
+    client = RedisCache.client
+    if not client:
+        return
+    try:
+        await client.incr(f"jobs:gen:{user_id}")
+        if job_id:
+            await client.delete(f"jobs:{user_id}:{job_id}")
+    except Exception:
+        pass
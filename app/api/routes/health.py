@@ -1,23 +1,35 @@
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Response
 from fastapi.responses import JSONResponse
-from app.db.mongodb import get_database
+from app.db.mongodb import MongoDB
 
 router = APIRouter()
 
+# The liveness payload never changes, so encode it once at import time
+# and reuse the same response object for every probe.
+_HEALTHY_BODY = orjson.dumps({"status": "healthy"})
+_HEALTHY_RESPONSE = Response(
+    content=_HEALTHY_BODY,
+    media_type="application/json",
+    status_code=200,
+)
+
 @router.get("/health")
 async def health_check():
     """
     Basic health check endpoint.
     """
-    return JSONResponse(content={"status": "healthy"}, status_code=200)
+    return _HEALTHY_RESPONSE
 
 @router.get("/health/ready")
-async def ready_health_check(db=Depends(get_database)):
+async def ready_health_check():
     """
     Ready health check endpoint including database connectivity.
+    Reads the cached result of the background MongoDB ping so probes
+    never issue a database round trip (or hang on a stalled primary).
     """
-    try:
-        await db.command("ping")
+    health = MongoDB.health_status()
+    if health["status"] == "up":
         return JSONResponse(
             content={
                 "status": "healthy",
@@ -29,16 +41,15 @@ async def ready_health_check(db=Depends(get_database)):
             },
             status_code=200
         )
-    except Exception as e:
-        return JSONResponse(
-            content={
-                "status": "unhealthy",
-                "database": "disconnected",
-                "error": str(e),
-                "services": {
-                    "database": "down",
-                    "api": "up"
-                }
-            },
-            status_code=503
-        )
\ No newline at end of file
+    return JSONResponse(
+        content={
+            "status": "unhealthy",
+            "database": "disconnected",
+            "error": health["error"],
+            "services": {
+                "database": "down",
+                "api": "up"
+            }
+        },
+        status_code=503
+    )
\ No newline at end of file
@@ -1,71 +1,190 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from app.core.security import get_current_user
+from typing import Annotated, Optional
+import orjson
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from app.api.cache import (
+    cache_get,
+    cache_set,
+    invalidate_job_cache,
+    list_l1,
+    list_l1_gen,
+)
+from app.core.security import CurrentUser
 from app.models.job import JobCreate, JobResponse, JobUpdate, JobList
 from app.services.job_service import JobService
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-@router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
+
+def _job_content(job: JobResponse) -> dict:
+    """
+    Dump a job response to a JSON-ready dict, skipping the
+    jsonable_encoder/outbound-validation pass FastAPI would otherwise run.
+    Null fields are dropped by JobResponse.model_dump's defaults.
+    """
+    return job.model_dump(mode="json")
+
+
+def parse_job_id(job_id: str) -> ObjectId:
+    """
+    Convert the job_id path parameter to an ObjectId once, at the edge.
+    Malformed IDs are rejected before any repository coroutine is
+    scheduled; they are indistinguishable from missing jobs to clients,
+    so they get the same 404.
+    """
+    try:
+        return ObjectId(job_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+
+# ObjectIds format as their 24-hex string, so cache keys and task URLs
+# built from this value are unchanged.
+JobId = Annotated[ObjectId, Depends(parse_job_id)]
+
+@router.post("/", status_code=status.HTTP_201_CREATED, responses={201: {"model": JobResponse}})
 async def create_job(
     job: JobCreate,
-    current_user: dict = Depends(get_current_user),
+    current_user: CurrentUser,
     job_service: JobService = Depends()
-) -> JobResponse:
+) -> ORJSONResponse:
     """
     Create a new job.
     """
     try:
-        return await job_service.create_job(job, current_user["id"])
+        created = await job_service.create_job(job, current_user["id"])
+        await invalidate_job_cache(current_user["id"])
+        return ORJSONResponse(
+            content=_job_content(created),
+            status_code=status.HTTP_201_CREATED
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
-@router.get("/{job_id}", response_model=JobResponse)
+@router.get("/{job_id}", responses={200: {"model": JobResponse}})
 async def get_job(
-    job_id: str,
-    current_user: dict = Depends(get_current_user),
+    job_id: JobId,
+    current_user: CurrentUser,
     job_service: JobService = Depends()
-) -> JobResponse:
+) -> ORJSONResponse:
     """
     Get a specific job by ID.
     """
-    job = await job_service.get_job(job_id, current_user["id"])
+    cache_key = f"jobs:{current_user['id']}:{job_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Raw path: the repository hands back a JSON-ready dict, so no
+    # Pydantic model is built just to be dumped again here.
+    job = await job_service.get_job_raw(job_id, current_user["id"])
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
-    return job
+    # OPT_UTC_Z so raw-path timestamps match the Z suffix pydantic's
+    # model_dump(mode="json") emits on every other path.
+    body = orjson.dumps(job, option=orjson.OPT_UTC_Z)
+    await cache_set(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
-@router.get("/", response_model=JobList)
+@router.get("/", responses={200: {"model": JobList}})
 async def list_jobs(
+    current_user: CurrentUser,
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
-    current_user: dict = Depends(get_current_user),
+    after: Optional[str] = None,
     job_service: JobService = Depends()
-) -> JobList:
+) -> ORJSONResponse:
     """
     List jobs with pagination and an optional status filter.
+
+    Prefer the `after` cursor (returned as `next_cursor`) over deep
+    `skip` values: cursor pages cost the same no matter how far into
+    the result set they are. `skip` remains supported for backward
+    compatibility.
     """
-    jobs = await job_service.list_jobs(
-        user_id=current_user["id"],
-        skip=skip,
-        limit=limit,
-        status=status
+    l1_key = (
+        current_user["id"],
+        list_l1_gen.get(current_user["id"], 0),
+        skip,
+        limit,
+        status,
+        after,
     )
-    return JobList(items=jobs, total=len(jobs), skip=skip, limit=limit)
+    l1_body = list_l1.get(l1_key)
+    if l1_body is not None:
+        return Response(content=l1_body, media_type="application/json")
 
-@router.put("/{job_id}", response_model=JobResponse)
+    generation = await cache_get(f"jobs:gen:{current_user['id']}") or b"0"
+    cache_key = (
+        f"jobs:{current_user['id']}:list:{generation.decode()}"
+        f":{skip}:{limit}:{status}:{after}"
+    )
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        list_l1[l1_key] = cached
+        return Response(content=cached, media_type="application/json")
+
+    next_cursor = None
+    if after is not None:
+        try:
+            jobs, total, next_cursor = await job_service.list_jobs_keyset(
+                user_id=current_user["id"],
+                limit=limit,
+                status=status,
+                after=after
+            )
+        except ValueError:
+            # The fastapi status module is shadowed by the query param here.
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid pagination cursor"
+            )
+        items = [_job_content(job) for job in jobs]
+    else:
+        # Raw path: the repository hands back JSON-ready dicts without a
+        # Pydantic pass (documents were validated on write).
+        items, total = await job_service.list_jobs_raw(
+            user_id=current_user["id"],
+            skip=skip,
+            limit=limit,
+            status=status
+        )
+    # Serialize the whole page in one pass instead of re-validating
+    # each item through the JobList response model. OPT_UTC_Z keeps the
+    # raw items' timestamps in the same Z-suffixed form pydantic emits.
+    body = orjson.dumps(
+        {
+            "items": items,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        },
+        option=orjson.OPT_UTC_Z,
+    )
+    list_l1[l1_key] = body
+    await cache_set(cache_key, body)
+    return Response(content=body, media_type="application/json")
+
+@router.put("/{job_id}", responses={200: {"model": JobResponse}})
 async def update_job(
-    job_id: str,
+    job_id: JobId,
     job_update: JobUpdate,
-    current_user: dict = Depends(get_current_user),
+    current_user: CurrentUser,
     job_service: JobService = Depends()
-) -> JobResponse:
+) -> ORJSONResponse:
     """
     Update a specific job.
     """
@@ -75,12 +194,13 @@ async def update_job(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
-    return job
+    await invalidate_job_cache(current_user["id"], job_id)
+    return ORJSONResponse(content=_job_content(job))
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_job(
-    job_id: str,
-    current_user: dict = Depends(get_current_user),
+    job_id: JobId,
+    current_user: CurrentUser,
     job_service: JobService = Depends()
 ) -> None:
     """
@@ -92,19 +212,21 @@ async def delete_job(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
+    await invalidate_job_cache(current_user["id"], job_id)
 
-@router.post("/{job_id}/process", response_model=JobResponse)
+@router.post("/{job_id}/process", responses={200: {"model": JobResponse}})
 async def process_job(
-    job_id: str,
+    job_id: JobId,
     job_service: JobService = Depends()
-) -> JobResponse:
+) -> ORJSONResponse:
     """
     Internal endpoint to process a job (called by Cloud Tasks).
     """
     try:
-        return await job_service.process_job(job_id)
+        processed = await job_service.process_job(job_id)
+        return ORJSONResponse(content=_job_content(processed))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
-        )
\ No newline at end of file
+        )
@@ -8,6 +8,7 @@ class BaseConfig(BaseSettings):
     """Base configuration class with common settings."""
 
     # API Settings
+    ENVIRONMENT: str = "development"
     PROJECT_NAME: str = "Job Management API"
     PROJECT_DESCRIPTION: str = "A scalable job management system built with FastAPI and GCP services"
     VERSION: str = "1.0.0"
@@ -16,6 +17,7 @@ class BaseConfig(BaseSettings):
     PORT: int = 8080
     LOG_LEVEL: str = "INFO"
     SHOW_DOCS: bool = True
+    WORKERS: int = 1
 
     # Azure AD Settings
     APP_CLIENT_ID: str
@@ -35,6 +37,10 @@ class BaseConfig(BaseSettings):
     MONGODB_MAX_CONNECTIONS: int = 100
     MONGODB_MIN_CONNECTIONS: int = 10
 
+    # Redis Cache Settings
+    REDIS_URL: Optional[str] = None
+    CACHE_TTL_SECONDS: int = 30
+
     # CORS Settings
     CORS_ORIGINS: list[str] = ["*"]
     CORS_CREDENTIALS: bool = True
@@ -60,6 +66,7 @@ class DevelopmentConfig(BaseConfig):
 class ProductionConfig(BaseConfig):
     """Production configuration."""
 
+    ENVIRONMENT: str = "production"
     DEBUG: bool = False
     SHOW_DOCS: bool = False
     CORS_ORIGINS: list[str] = []  # Specify allowed origins in production
@@ -68,6 +75,7 @@ class ProductionConfig(BaseConfig):
 class TestingConfig(BaseConfig):
     """Testing configuration."""
 
+    ENVIRONMENT: str = "testing"
     DEBUG: bool = True
     LOG_LEVEL: str = "DEBUG"
     TESTING: bool = True
@@ -1,8 +1,19 @@
-from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from typing import Any, Optional
 
+# The 500 body is constant, so encode it once at import time instead of
+# rebuilding the dict and re-encoding on every failure.
+_ERR_500_BODY = orjson.dumps({
+    "error": {
+        "code": "internal_server_error",
+        "message": "An unexpected error occurred",
+        "status": status.HTTP_500_INTERNAL_SERVER_ERROR
+    }
+})
+
 class CustomHTTPException(HTTPException):
     """
     Custom HTTP Exception with additional fields.
@@ -17,11 +28,11 @@ class CustomHTTPException(HTTPException):
         super().__init__(status_code=status_code, detail=detail, headers=headers)
         self.code = code
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """
     Handle HTTP exceptions.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -36,11 +47,11 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle request validation errors.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
@@ -52,17 +63,14 @@ async def validation_exception_handler(
         }
     )
 
-async def custom_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def custom_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle unexpected exceptions.
+    Returns the pre-encoded 500 body; under a partial outage this path
+    can run many times per second.
     """
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": {
-                "code": "internal_server_error",
-                "message": "An unexpected error occurred",
-                "status": status.HTTP_500_INTERNAL_SERVER_ERROR
-            }
-        }
+    return Response(
+        content=_ERR_500_BODY,
+        media_type="application/json",
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
     )
\ No newline at end of file
@@ -1,68 +1,112 @@
 import time
 import logging
-from typing import Callable
+
+import orjson
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+# Pre-encoded 500 payload shared by the error paths below; the body never
+# varies, so there is nothing to build per failure.
+_ERR_500_BODY = orjson.dumps({
+    "error": {
+        "code": "internal_server_error",
+        "message": "An unexpected error occurred",
+        "status": 500
+    }
+})
+
+class ErrorHandlerMiddleware:
+    """
+    Pure ASGI middleware catching unhandled exceptions.
+    Avoids BaseHTTPMiddleware's per-request task group and body queue.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
-        except Exception as e:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
             logger.exception("Unhandled exception occurred")
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": {
-                        "code": "internal_server_error",
-                        "message": "An unexpected error occurred",
-                        "status": 500
-                    }
-                }
+            if response_started:
+                # Headers already went out; nothing sane left to send.
+                raise
+            response = Response(
+                content=_ERR_500_BODY,
+                media_type="application/json",
+                status_code=500
             )
+            await response(scope, receive, send)
+
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware logging the request lifecycle and timing.
+    Stamps the X-Process-Time header directly on the response start
+    message instead of round-tripping through a Response object.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        request = Request(scope)
+        status_code = 0
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        
         # Log request
         logger.info(
             "Request started",
             extra={
                 "method": request.method,
                 "url": str(request.url),
-                "client_ip": request.client.host,
+                "client_ip": request.client.host if request.client else None,
                 "user_agent": request.headers.get("user-agent"),
             }
         )
-        
-        response = await call_next(request)
-        
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Monotonic clock, integer math, and a single bytes
+                # format: no float subtract or str() of a float.
+                elapsed_us = (time.perf_counter_ns() - start_ns) // 1000
+                message.setdefault("headers", []).append(
+                    (b"x-process-time", b"%d.%06d" % divmod(elapsed_us, 1_000_000))
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
         # Calculate processing time
-        process_time = time.time() - start_time
-        
+        process_time = (time.perf_counter_ns() - start_ns) / 1e9
+
         # Log response
         logger.info(
             "Request completed",
             extra={
                 "method": request.method,
                 "url": str(request.url),
-                "status_code": response.status_code,
+                "status_code": status_code,
                 "processing_time": process_time,
             }
         )
-        
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
-
-async def error_handler_middleware(request: Request, call_next: Callable) -> Response:
-    middleware = ErrorHandlerMiddleware(call_next)
-    return await middleware.dispatch(request, call_next)
-
-async def logging_middleware(request: Request, call_next: Callable) -> Response:
-    middleware = LoggingMiddleware(call_next)
-    return await middleware.dispatch(request, call_next)
\ No newline at end of file
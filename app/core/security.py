@@ -1,7 +1,7 @@
-from typing import Any
+from typing import Annotated, Any
 from fastapi import HTTPException, Depends, status
 from fastapi_azure_auth import SingleTenantAzureAuthorizationCodeBearer
-from config import settings
+from app.core.config import settings
 
 # Azure AD authentication scheme
 azure_scheme = SingleTenantAzureAuthorizationCodeBearer(
@@ -27,4 +27,9 @@ async def get_current_user(token: str = Depends(azure_scheme)) -> dict[str, Any]
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
+
+# Shared request-scoped dependency: every endpoint declaring CurrentUser
+# resolves the same cached get_current_user result, so the Azure token is
+# validated at most once per request.
+CurrentUser = Annotated[dict[str, Any], Depends(get_current_user)]
\ No newline at end of file
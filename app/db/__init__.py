@@ -4,6 +4,11 @@ from app.db.mongodb import (
     close_mongo_connection,
     get_database
 )
+from app.db.redis import (
+    RedisCache,
+    connect_to_redis,
+    close_redis_connection
+)
 from app.db.repositories.jobs import JobRepository
 
 __all__ = [
@@ -11,5 +16,8 @@ __all__ = [
     "connect_to_mongo",
     "close_mongo_connection",
     "get_database",
+    "RedisCache",
+    "connect_to_redis",
+    "close_redis_connection",
     "JobRepository"
 ]
\ No newline at end of file
@@ -20,18 +20,33 @@
 # - Type-safe database access
 # - Performance monitoring capabilities
 
+import asyncio
 import logging
+from datetime import datetime, timezone
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from typing import Optional
+from typing import Any, Dict, Optional
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# How often the background monitor pings MongoDB and how long a single
+# ping may take before it is considered failed.
+HEALTH_CHECK_INTERVAL_SECONDS = 5.0
+HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+
+# Hard budget for the connectivity-verification ping at startup; the
+# driver's serverSelectionTimeoutMS alone doesn't bound a stalled server.
+CONNECT_PING_TIMEOUT_SECONDS = 5.0
+
 class MongoDB:
     client: Optional[AsyncIOMotorClient] = None
     db: Optional[AsyncIOMotorDatabase] = None
+    # Starts as "down" until the first successful ping so probes never
+    # report healthy before connectivity is verified.
+    _health: Dict[str, Any] = {"status": "down", "checked_at": None, "error": "not checked yet"}
+    _health_task: Optional[asyncio.Task] = None
 
     @classmethod
     async def connect(cls) -> None:
@@ -39,26 +54,48 @@ class MongoDB:
         Initialize database connection.
         Sets up connection pool and verifies connectivity.
         """
+        # Bind settings once; each attribute access goes through
+        # pydantic-settings' descriptor machinery.
+        url = settings.MONGODB_URL
+        database_name = settings.DATABASE_NAME
         try:
             cls.client = AsyncIOMotorClient(
-                settings.MONGODB_URL,
+                url,
                 maxPoolSize=settings.MONGODB_MAX_CONNECTIONS,
                 minPoolSize=settings.MONGODB_MIN_CONNECTIONS,
                 serverSelectionTimeoutMS=5000,
+                # Recycle sockets idle for 30 minutes and bound how long
+                # a checkout may wait on an exhausted pool.
+                maxIdleTimeMS=1_800_000,
+                waitQueueTimeoutMS=5000,
+            )
+            cls.db = cls.client[database_name]
+
+            # Verify connection, bounded so a stalled server can't hang startup
+            await asyncio.wait_for(
+                cls.client.admin.command('ping'),
+                timeout=CONNECT_PING_TIMEOUT_SECONDS,
             )
-            cls.db = cls.client[settings.DATABASE_NAME]
-            
-            # Verify connection
-            await cls.client.admin.command('ping')
-            
+
+            # Pre-warm the pool: the driver opens sockets lazily, so
+            # issue minPoolSize concurrent pings now and pay connection
+            # setup at startup rather than on the first requests.
+            await asyncio.gather(
+                *[
+                    cls.client.admin.command("ping")
+                    for _ in range(settings.MONGODB_MIN_CONNECTIONS)
+                ],
+                return_exceptions=True,
+            )
+
             logger.info(
                 "Connected to MongoDB",
                 extra={
-                    "database": settings.DATABASE_NAME,
-                    "host": settings.MONGODB_URL.split("@")[-1]
+                    "database": database_name,
+                    "host": url.split("@")[-1]
                 }
             )
-        except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+        except (ConnectionFailure, ServerSelectionTimeoutError, asyncio.TimeoutError) as e:
             logger.error(
                 "Failed to connect to MongoDB",
                 extra={"error": str(e)}
@@ -77,6 +114,67 @@ class MongoDB:
             cls.db = None
             logger.info("Disconnected from MongoDB")
 
+    @classmethod
+    async def _health_monitor(cls) -> None:
+        """
+        Periodically ping MongoDB and cache the result, so health probes
+        read in-memory state instead of issuing a round trip per probe.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(
+                    cls.client.admin.command("ping"),
+                    timeout=HEALTH_CHECK_TIMEOUT_SECONDS,
+                )
+                cls._health = {
+                    "status": "up",
+                    "checked_at": datetime.now(timezone.utc).isoformat(),
+                    "error": None,
+                }
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                cls._health = {
+                    "status": "down",
+                    "checked_at": datetime.now(timezone.utc).isoformat(),
+                    "error": str(e),
+                }
+                logger.warning(
+                    "MongoDB health check failed",
+                    extra={"error": str(e)}
+                )
+            await asyncio.sleep(HEALTH_CHECK_INTERVAL_SECONDS)
+
+    @classmethod
+    def start_health_monitor(cls) -> None:
+        """
+        Start the background health monitor task.
+        Called during application startup after the client is connected.
+        """
+        if cls._health_task is None or cls._health_task.done():
+            cls._health_task = asyncio.create_task(cls._health_monitor())
+
+    @classmethod
+    async def stop_health_monitor(cls) -> None:
+        """
+        Cancel the background health monitor task.
+        Called during application shutdown.
+        """
+        if cls._health_task:
+            cls._health_task.cancel()
+            try:
+                await cls._health_task
+            except asyncio.CancelledError:
+                pass
+            cls._health_task = None
+
+    @classmethod
+    def health_status(cls) -> Dict[str, Any]:
+        """
+        Return the most recent cached health-check result.
+        """
+        return cls._health
+
     @classmethod
     def get_db(cls) -> AsyncIOMotorDatabase:
         """
@@ -93,12 +191,14 @@ async def connect_to_mongo() -> None:
     Called during application startup.
     """
     await MongoDB.connect()
+    MongoDB.start_health_monitor()
 
 async def close_mongo_connection() -> None:
     """
     Close MongoDB connection.
     Called during application shutdown.
     """
+    await MongoDB.stop_health_monitor()
     await MongoDB.disconnect()
 
 async def get_database() -> AsyncIOMotorDatabase:
@@ -0,0 +1,62 @@
+import logging
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class RedisCache:
+    """
+    Optional Redis connection used as a response cache.
+    The application runs fine without it: when REDIS_URL is unset or the
+    connection fails, callers see no client and skip caching entirely.
+    """
+
+    client: Optional[aioredis.Redis] = None
+
+    @classmethod
+    async def connect(cls) -> None:
+        """
+        Initialize the Redis connection if configured.
+        Failures are logged but never fatal — the cache is best effort.
+        """
+        if not settings.REDIS_URL:
+            logger.info("REDIS_URL not configured, response caching disabled")
+            return
+        try:
+            cls.client = aioredis.from_url(settings.REDIS_URL)
+            await cls.client.ping()
+            logger.info("Connected to Redis")
+        except Exception as e:
+            cls.client = None
+            logger.warning(
+                "Failed to connect to Redis, response caching disabled",
+                extra={"error": str(e)}
+            )
+
+    @classmethod
+    async def disconnect(cls) -> None:
+        """
+        Close the Redis connection.
+        Called during application shutdown.
+        """
+        if cls.client:
+            await cls.client.aclose()
+            cls.client = None
+            logger.info("Disconnected from Redis")
+
+async def connect_to_redis() -> None:
+    """
+    Connect to Redis.
+    Called during application startup.
+    """
+    await RedisCache.connect()
+
+async def close_redis_connection() -> None:
+    """
+    Close Redis connection.
+    Called during application shutdown.
+    """
+    await RedisCache.disconnect()
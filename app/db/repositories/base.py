@@ -28,6 +28,7 @@
 # - Error handling
 # - Performance optimization
 
+from functools import lru_cache
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
@@ -38,6 +39,17 @@ from app.models.base import MongoModel
 
 ModelType = TypeVar("ModelType", bound=MongoModel)
 
+
+@lru_cache(maxsize=4096)
+def _oid(id) -> ObjectId:
+    """
+    Convert a hex string to ObjectId, caching recent conversions so the
+    24-hex validation isn't repeated for IDs fetched in bursts.
+    Already-typed ObjectIds (from the parse_job_id dependency) pass
+    straight through.
+    """
+    return id if isinstance(id, ObjectId) else ObjectId(id)
+
 class BaseRepository(Generic[ModelType]):
     """
     Base repository implementing common database operations.
@@ -53,45 +65,78 @@ class BaseRepository(Generic[ModelType]):
         self.db = db
         self.collection = db[model.__name__.lower()]
 
-    async def get(self, id: str) -> Optional[ModelType]:
+    def _from_doc(self, doc: Dict[str, Any]) -> ModelType:
         """
-        Retrieve a document by ID.
+        Build a model from a stored document without re-validating it;
+        documents were validated on write. Subclasses override this to
+        decode storage-only encodings.
         """
-        doc = await self.collection.find_one({"_id": ObjectId(id)})
-        return self.model(**doc) if doc else None
+        return self.model.model_construct(**doc)
 
-    async def get_by_query(self, query: Dict[str, Any]) -> Optional[ModelType]:
+    async def get(
+        self,
+        id: str,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[ModelType]:
         """
-        Retrieve a document by custom query.
+        Retrieve a document by ID, optionally fetching only a projection
+        of its fields.
+        Skips validation since stored documents were validated on write.
         """
-        doc = await self.collection.find_one(query)
-        return self.model(**doc) if doc else None
+        doc = await self.collection.find_one({"_id": _oid(id)}, projection)
+        return self._from_doc(doc) if doc else None
+
+    async def get_by_query(
+        self,
+        query: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[ModelType]:
+        """
+        Retrieve a document by custom query, optionally fetching only a
+        projection of its fields.
+        Skips validation since stored documents were validated on write.
+        """
+        doc = await self.collection.find_one(query, projection)
+        return self._from_doc(doc) if doc else None
 
     async def list(
         self,
         query: Dict[str, Any] = None,
         skip: int = 0,
         limit: int = 100,
-        sort: List[tuple] = None
+        sort: List[tuple] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        hint: Optional[str] = None
     ) -> List[ModelType]:
         """
         List documents with pagination and sorting.
+        Pulls the whole page in a single batch instead of iterating the
+        cursor document-at-a-time. An index name may be passed as `hint`
+        to pin the query plan.
         """
-        cursor = self.collection.find(query or {})
-        
+        cursor = self.collection.find(query or {}, projection, batch_size=limit)
+
         if sort:
             cursor = cursor.sort(sort)
-            
+
+        if hint:
+            cursor = cursor.hint(hint)
+
         cursor = cursor.skip(skip).limit(limit)
-        
-        return [self.model(**doc) async for doc in cursor]
+
+        docs = await cursor.to_list(length=limit)
+        return [self._from_doc(doc) for doc in docs]
 
     async def create(self, data: Dict[str, Any]) -> ModelType:
         """
         Create a new document.
+        The full document is already in memory before the insert, so the
+        model is assembled locally from it plus the assigned _id instead
+        of paying a second round trip to read it back.
         """
-        doc = await self.collection.insert_one(data)
-        return await self.get(str(doc.inserted_id))
+        result = await self.collection.insert_one(data)
+        data["_id"] = result.inserted_id
+        return self._from_doc(data)
 
     async def update(
         self,
@@ -103,7 +148,7 @@ class BaseRepository(Generic[ModelType]):
         Update a document by ID.
         """
         doc = await self.collection.find_one_and_update(
-            {"_id": ObjectId(id)},
+            {"_id": _oid(id)},
             {"$set": data},
             upsert=upsert,
             return_document=True
@@ -114,7 +159,7 @@ class BaseRepository(Generic[ModelType]):
         """
         Delete a document by ID.
         """
-        result = await self.collection.delete_one({"_id": ObjectId(id)})
+        result = await self.collection.delete_one({"_id": _oid(id)})
         return result.deleted_count > 0
 
     async def count(self, query: Dict[str, Any] = None) -> int:
@@ -1,15 +1,123 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta, timezone
+import asyncio
 import logging
 
-from bson import ObjectId
-from pymongo import ReturnDocument
+import msgspec
+import orjson
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from fastapi import Depends
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel, ReturnDocument
 
-from app.db.repositories.base import BaseRepository
-from app.models.job import Job, JobStatus
+from app.db.mongodb import get_database
+from app.db.redis import RedisCache
+from app.db.repositories.base import BaseRepository, _oid
+from app.models.job import CODE_TO_STATUS, STATUS_TO_CODE, Job, JobRow, JobStatus
 
 logger = logging.getLogger(__name__)
 
+# Bound once at import: avoids the datetime.timezone attribute lookup on
+# every timestamp taken in the write paths.
+_UTC = timezone.utc
+
+# TTL for the cached job-stats aggregation; dashboards tolerate a few
+# seconds of staleness in exchange for skipping the collection scan.
+STATS_CACHE_TTL_SECONDS = 15
+
+# Batch size for cleanup_old_jobs: bounds how many documents a single
+# delete_many touches so write locks and oplog entries stay small.
+CLEANUP_BATCH_SIZE = 1000
+
+# Fields needed to build a JobResponse page. payload (up to 1MB per the
+# model guard) and attempts are internal-only and never leave the
+# repository on list reads; skipping them cuts network bytes and BSON
+# decode time for every page.
+_LIST_PROJECTION = {
+    "user_id": 1,
+    "title": 1,
+    "description": 1,
+    "status": 1,
+    "priority": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "started_at": 1,
+    "completed_at": 1,
+    "result": 1,
+    "error": 1,
+}
+
+# Decode options for the raw read paths: tz-aware datetimes so raw and
+# Pydantic reads serialize timestamps identically (offset-aware UTC),
+# matching what the write paths store.
+_RAW_DECODE_OPTIONS = CodecOptions(tz_aware=True, tzinfo=timezone.utc)
+
+# Legal state machine: statuses a job may be in for each transition
+# target. Enforced server-side in update_status so concurrent writers
+# can't produce lost updates (e.g. COMPLETED overwritten by PROCESSING).
+ALLOWED_PREVIOUS_STATUSES: Dict[JobStatus, List[JobStatus]] = {
+    JobStatus.QUEUED: [JobStatus.FAILED, JobStatus.CANCELLED],
+    # PROCESSING -> PROCESSING covers stalled-job retries
+    JobStatus.PROCESSING: [JobStatus.QUEUED, JobStatus.PROCESSING],
+    JobStatus.COMPLETED: [JobStatus.PROCESSING],
+    JobStatus.FAILED: [JobStatus.QUEUED, JobStatus.PROCESSING],
+    JobStatus.CANCELLED: [JobStatus.QUEUED, JobStatus.PROCESSING],
+}
+
+
+def _status_code(status: Any) -> Any:
+    """
+    Map a status (enum or API string) to its storage int code.
+    Unknown values pass through unchanged so bad filters simply match
+    nothing, as they did with string storage.
+    """
+    try:
+        return STATUS_TO_CODE[JobStatus(status)]
+    except (KeyError, ValueError):
+        return status
+
+
+def _doc_to_api(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Shape a decoded job document like a serialized JobResponse: string
+    id, string status, internal-only and null fields dropped. Used by
+    the raw read paths that hand dicts straight to orjson.
+    """
+    doc["id"] = str(doc.pop("_id"))
+    status = doc.get("status")
+    if isinstance(status, int):
+        doc["status"] = CODE_TO_STATUS.get(status, status)
+    doc.pop("user_id", None)
+    doc.pop("payload", None)
+    doc.pop("attempts", None)
+    return {key: value for key, value in doc.items() if value is not None}
+
+
+def _row_from_doc(doc: Dict[str, Any]) -> JobRow:
+    """
+    Build the internal JobRow struct from a stored document; unknown
+    fields (payload) are dropped by msgspec.convert.
+    """
+    doc["id"] = str(doc.pop("_id"))
+    code = doc.get("status")
+    if isinstance(code, int):
+        doc["status"] = CODE_TO_STATUS.get(code, code)
+    return msgspec.convert(doc, JobRow, strict=False)
+
+
+def _status_bucket(status: Any) -> str:
+    """
+    Normalize any status representation (enum, string or storage code)
+    to the API string used as a counter-bucket / stats key.
+    """
+    if isinstance(status, int):
+        status = CODE_TO_STATUS.get(status, status)
+    if isinstance(status, JobStatus):
+        return status.value
+    return str(status)
+
 
 class JobRepository(BaseRepository[Job]):
     """
@@ -17,6 +125,99 @@ class JobRepository(BaseRepository[Job]):
     Extends base repository with job-specific queries and operations.
     """
 
+    def __init__(self, db: AsyncIOMotorDatabase = Depends(get_database)):
+        super().__init__(Job, db)
+        # Live per-(user, status) counters maintained on every write, so
+        # stats reads are point lookups instead of aggregation scans.
+        self.counters = db["job_counters"]
+        # Raw-BSON view of the collection for hot list reads: documents
+        # come back as undecoded byte blobs instead of per-field dicts.
+        self.raw_collection = self.collection.with_options(
+            codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
+
+    def _from_doc(self, doc: Dict[str, Any]) -> Job:
+        code = doc.get("status")
+        if isinstance(code, int):
+            doc["status"] = CODE_TO_STATUS.get(code, code)
+        return self.model.model_construct(**doc)
+
+    async def ensure_indexes(self) -> None:
+        """
+        Create the indexes backing the hot query paths.
+        Called once at application startup; create_indexes is a no-op
+        for indexes that already exist.
+        """
+        await self.collection.create_indexes([
+            # Unfiltered per-user listing (filter + sort from the
+            # index). The _id suffix matches the keyset sort
+            # (created_at, _id) so cursor pages never pay a blocking
+            # in-memory sort.
+            IndexModel([("user_id", 1), ("created_at", -1), ("_id", -1)]),
+            # Status-filtered per-user listing, same tie-break suffix
+            IndexModel([
+                ("user_id", 1), ("status", 1), ("created_at", -1), ("_id", -1)
+            ]),
+            # find_stalled_jobs: partial index over only the PROCESSING
+            # subset, a tiny always-cache-resident fraction of the
+            # collection.
+            IndexModel(
+                [("started_at", 1)],
+                name="proc_started",
+                partialFilterExpression={
+                    "status": STATUS_TO_CODE[JobStatus.PROCESSING]
+                },
+            ),
+            # Worker dequeue order over only the QUEUED subset
+            IndexModel(
+                [("priority", -1), ("created_at", 1)],
+                name="queue_pull",
+                partialFilterExpression={
+                    "status": STATUS_TO_CODE[JobStatus.QUEUED]
+                },
+            ),
+            # cleanup_old_jobs range delete
+            IndexModel([("created_at", 1), ("status", 1)]),
+        ])
+        # Idempotent migration of documents written before statuses were
+        # stored as int codes; matches only the legacy string form.
+        # Gated behind a one-time marker: once every document carries a
+        # code, the bare string-equality filters are unindexed full
+        # scans, which a cold start should not pay for. Concurrent
+        # startups may both run the migration; the updates themselves
+        # are idempotent.
+        marker = self.db["schema_migrations"]
+        if await marker.find_one({"_id": "job_status_int_codes"}) is None:
+            for status, code in STATUS_TO_CODE.items():
+                await self.collection.update_many(
+                    {"status": status.value}, {"$set": {"status": code}}
+                )
+            # Seed the live counters from the jobs that predate them,
+            # riding the same one-time marker. Without this, stats
+            # exclude every pre-existing job once a scope has its first
+            # post-deploy write, and delete/cleanup decrements on
+            # unseeded buckets upsert negative counts. $set (not $inc)
+            # so racing startups converge on the same totals.
+            async for bucket in self.collection.aggregate([
+                {"$group": {
+                    "_id": {"user_id": "$user_id", "status": "$status"},
+                    "count": {"$sum": 1},
+                }},
+            ]):
+                await self.counters.update_one(
+                    {"_id": {
+                        "user_id": bucket["_id"]["user_id"],
+                        "status": _status_bucket(bucket["_id"]["status"]),
+                    }},
+                    {"$set": {"count": bucket["count"]}},
+                    upsert=True,
+                )
+            await marker.update_one(
+                {"_id": "job_status_int_codes"},
+                {"$set": {"completed_at": datetime.now(_UTC)}},
+                upsert=True,
+            )
+
     async def create(
         self,
         user_id: str,
@@ -26,30 +227,72 @@ class JobRepository(BaseRepository[Job]):
         """
         Create a new job with user context.
         """
+        now = datetime.now(_UTC)
         job_data = {
             **data,
             "user_id": user_id,
-            "status": status,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc),
+            "status": STATUS_TO_CODE[status],
+            "created_at": now,
+            "updated_at": now,
             "attempts": 0,
         }
-        logger.info(
-            "Creating new job",
-            extra={
+        # Guarded so the extra dict isn't built when INFO is filtered
+        # out; the payload itself (up to 1MB) is only logged at DEBUG.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Creating new job",
+                extra={"user_id": user_id, "status": status},
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Job payload", extra={"data": data})
+        job = await super().create(job_data)
+        await self._bump_status_counter(user_id, status, 1)
+        await self._invalidate_stats_cache(user_id)
+        return job
+
+    async def create_many(
+        self,
+        user_id: str,
+        items: List[Dict[str, Any]],
+        status: JobStatus = JobStatus.QUEUED,
+    ) -> List[Job]:
+        """
+        Create a batch of jobs with one insert_many round trip.
+        No re-fetch is needed: insert_many returns the assigned _ids, so
+        the models are assembled from the documents already in memory.
+        """
+        if not items:
+            return []
+        now = datetime.now(_UTC)
+        docs = [
+            {
+                **data,
                 "user_id": user_id,
-                "status": status,
-                "data": data,
-            },
-        )
-        return await super().create(job_data)
+                "status": STATUS_TO_CODE[status],
+                "created_at": now,
+                "updated_at": now,
+                "attempts": 0,
+            }
+            for data in items
+        ]
+        result = await self.collection.insert_many(docs, ordered=False)
+        for doc, inserted_id in zip(docs, result.inserted_ids):
+            doc["_id"] = inserted_id
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Created job batch",
+                extra={"user_id": user_id, "count": len(docs), "status": status},
+            )
+        await self._bump_status_counter(user_id, status, len(docs))
+        await self._invalidate_stats_cache(user_id)
+        return [self._from_doc(doc) for doc in docs]
 
     async def get(self, job_id: str, user_id: str) -> Optional[Job]:
         """
         Get job by ID with user verification.
         """
         return await self.get_by_query(
-            {"_id": ObjectId(job_id), "user_id": user_id}
+            {"_id": _oid(job_id), "user_id": user_id}
         )
 
     async def get_by_id(self, job_id: str) -> Optional[Job]:
@@ -58,6 +301,22 @@ class JobRepository(BaseRepository[Job]):
         """
         return await super().get(job_id)
 
+    async def get_raw(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job by ID as a JSON-ready dict, with user verification.
+
+        Raw-codec counterpart to get, for the hot GET path: one
+        bson.decode instead of the BSON->Pydantic round trip, and the
+        dict goes straight to orjson. Validation already happened on
+        write.
+        """
+        raw = await self.raw_collection.find_one(
+            {"_id": _oid(job_id), "user_id": user_id}, _LIST_PROJECTION
+        )
+        if raw is None:
+            return None
+        return _doc_to_api(bson.decode(raw.raw, codec_options=_RAW_DECODE_OPTIONS))
+
     async def list_by_user(
         self, user_id: str, status: Optional[str] = None, skip: int = 0, limit: int = 100
     ) -> List[Job]:
@@ -66,88 +325,392 @@ class JobRepository(BaseRepository[Job]):
         """
         query = {"user_id": user_id}
         if status:
-            query["status"] = status
+            query["status"] = _status_code(status)
         return await self.list(
-            query=query, skip=skip, limit=limit, sort=[("created_at", -1)]
+            query=query,
+            skip=skip,
+            limit=limit,
+            sort=[("created_at", -1)],
+            projection=_LIST_PROJECTION,
+        )
+
+    async def list_by_user_raw(
+        self, user_id: str, status: Optional[str] = None, skip: int = 0, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        List jobs for a user as JSON-ready dicts.
+
+        Skips the BSON->Pydantic->dict round trip of list_by_user: the
+        raw cursor hands back undecoded blobs, bson.decode runs once per
+        document, and the dicts go straight to orjson. Validation
+        already happened on write.
+        """
+        query: Dict[str, Any] = {"user_id": user_id}
+        if status:
+            query["status"] = _status_code(status)
+        cursor = (
+            self.raw_collection.find(query, _LIST_PROJECTION, batch_size=limit)
+            .sort([("created_at", -1)])
+            .skip(skip)
+            .limit(limit)
         )
+        raw_docs = await cursor.to_list(length=limit)
+        return [
+            _doc_to_api(bson.decode(raw.raw, codec_options=_RAW_DECODE_OPTIONS))
+            for raw in raw_docs
+        ]
+
+    async def list_by_user_keyset(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: int = 100,
+    ) -> Tuple[List[Job], Optional[Tuple[datetime, str]]]:
+        """
+        List jobs for a user with keyset (cursor) pagination.
+
+        Unlike skip/limit, the (created_at, _id) cursor lets MongoDB seek
+        straight to the page boundary via the compound index, so latency
+        stays O(limit) no matter how deep the page. Returns the page and
+        the cursor for the next one (None when this page wasn't full).
+        """
+        query: Dict[str, Any] = {"user_id": user_id}
+        if status:
+            query["status"] = _status_code(status)
+        if after:
+            last_created_at, last_id = after
+            query["$or"] = [
+                {"created_at": {"$lt": last_created_at}},
+                {"created_at": last_created_at, "_id": {"$lt": _oid(last_id)}},
+            ]
+        items = await self.list(
+            query=query,
+            limit=limit,
+            sort=[("created_at", -1), ("_id", -1)],
+            projection=_LIST_PROJECTION,
+        )
+        next_cursor = None
+        if items and len(items) == limit:
+            next_cursor = (items[-1].created_at, str(items[-1].id))
+        return items, next_cursor
+
+    async def count_by_user(self, user_id: str, status: Optional[str] = None) -> int:
+        """
+        Count jobs for specific user with optional status filter.
+        """
+        query = {"user_id": user_id}
+        if status:
+            query["status"] = _status_code(status)
+        return await self.count(query)
+
+    async def claim(self, job_id: Any) -> Optional[Job]:
+        """
+        Atomically claim a QUEUED job for processing.
+
+        One find_one_and_update replaces the read + status-write pair
+        and doubles as the idempotency guard: a retried delivery finds
+        the job no longer QUEUED and matches nothing. Returns the job in
+        its PROCESSING state, or None when it is missing or not QUEUED.
+        """
+        doc = await self.collection.find_one_and_update(
+            {"_id": _oid(job_id), "status": STATUS_TO_CODE[JobStatus.QUEUED]},
+            [
+                {
+                    "$set": {
+                        "status": STATUS_TO_CODE[JobStatus.PROCESSING],
+                        "started_at": "$$NOW",
+                        "updated_at": "$$NOW",
+                        "attempts": {
+                            "$add": [{"$ifNull": ["$attempts", 0]}, 1]
+                        },
+                    }
+                }
+            ],
+            return_document=ReturnDocument.AFTER,
+        )
+        if not doc:
+            return None
+        await self._shift_status_counter(
+            doc["user_id"], JobStatus.QUEUED, JobStatus.PROCESSING
+        )
+        await self._invalidate_stats_cache(doc["user_id"])
+        return self._from_doc(doc)
 
     async def update_status(
         self, job_id: str, status: JobStatus, error: Optional[str] = None
     ) -> Optional[Job]:
         """
-        Update job status with optional error message.
+        Update job status with optional error message, atomically and in
+        one round trip.
+
+        The filter only matches jobs in a legal previous state for the
+        requested transition, so concurrent writers cannot clobber a
+        terminal status; returns None when the job is missing or the
+        transition is not allowed. Timestamps are set server-side via
+        $$NOW so they are consistent across app instances — the returned
+        model carries a client-clock approximation of them.
         """
-        update_data = {
-            "status": status,
-            "updated_at": datetime.now(timezone.utc),
+        set_stage: Dict[str, Any] = {
+            "status": STATUS_TO_CODE[status],
+            "updated_at": "$$NOW",
         }
         if status == JobStatus.PROCESSING:
-            update_data["started_at"] = datetime.now(timezone.utc)
+            set_stage["started_at"] = "$$NOW"
         elif status in [JobStatus.COMPLETED, JobStatus.FAILED]:
-            update_data["completed_at"] = datetime.now(timezone.utc)
+            set_stage["completed_at"] = "$$NOW"
         if error:
-            update_data["error"] = error
-
-        logger.info(
-            "Updating job status",
-            extra={
-                "job_id": job_id,
-                "new_status": status,
-                "error": error,
+            set_stage["error"] = error
+
+        now = datetime.now(_UTC)
+        update_data = {
+            key: (now if value == "$$NOW" else value)
+            for key, value in set_stage.items()
+        }
+        update_data["status"] = status
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updating job status",
+                extra={"job_id": job_id, "new_status": status, "error": error},
+            )
+        # BEFORE gives us the previous status for the counter shift; the
+        # returned model is the old document with the update merged in.
+        old_doc = await self.collection.find_one_and_update(
+            {
+                "_id": _oid(job_id),
+                "status": {
+                    "$in": [
+                        STATUS_TO_CODE[s]
+                        for s in ALLOWED_PREVIOUS_STATUSES[status]
+                    ]
+                },
             },
+            [{"$set": set_stage}],
+            return_document=ReturnDocument.BEFORE,
+        )
+        if not old_doc:
+            return None
+        await self._shift_status_counter(
+            old_doc["user_id"], old_doc.get("status"), status
+        )
+        await self._invalidate_stats_cache(old_doc["user_id"])
+        return self.model.model_construct(**{**old_doc, **update_data})
+
+    async def update(
+        self,
+        job_id: str,
+        data: Dict[str, Any],
+        upsert: bool = False,
+    ) -> Optional[Job]:
+        """
+        Update a job, encoding any status in the payload to its storage
+        code first. Always bumps updated_at (unless the caller already
+        set it): the response memo in the service layer is keyed on it,
+        so a write that left it unchanged would serve stale bodies.
+        """
+        if "status" in data:
+            data = {**data, "status": _status_code(data["status"])}
+        if "updated_at" not in data:
+            data = {**data, "updated_at": datetime.now(_UTC)}
+        return await super().update(job_id, data, upsert=upsert)
+
+    async def delete(self, job_id: str) -> bool:
+        """
+        Delete a job, keeping the status counters in sync.
+        """
+        doc = await self.collection.find_one_and_delete(
+            {"_id": _oid(job_id)},
+            projection={"user_id": 1, "status": 1},
+        )
+        if not doc:
+            return False
+        await self._bump_status_counter(doc["user_id"], doc.get("status"), -1)
+        await self._invalidate_stats_cache(doc["user_id"])
+        return True
+
+    async def _bump_status_counter(
+        self, user_id: str, status: Any, delta: int
+    ) -> None:
+        """
+        Atomically adjust the live counter for one (user, status) bucket.
+        """
+        if status is None:
+            return
+        await self.counters.update_one(
+            {"_id": {"user_id": user_id, "status": _status_bucket(status)}},
+            {"$inc": {"count": delta}},
+            upsert=True,
         )
-        return await self.update(job_id, update_data)
+
+    async def _shift_status_counter(
+        self, user_id: str, old_status: Any, new_status: Any
+    ) -> None:
+        """
+        Move one job between status buckets on a transition.
+        """
+        if _status_bucket(old_status) == _status_bucket(new_status):
+            return
+        await self._bump_status_counter(user_id, new_status, 1)
+        await self._bump_status_counter(user_id, old_status, -1)
 
     async def increment_attempts(self, job_id: str) -> Optional[Job]:
         """
         Increment the number of processing attempts for a job.
         """
         return await self.collection.find_one_and_update(
-            {"_id": ObjectId(job_id)},
+            {"_id": _oid(job_id)},
             {
                 "$inc": {"attempts": 1},
-                "$set": {"updated_at": datetime.now(timezone.utc)},
+                "$set": {"updated_at": datetime.now(_UTC)},
             },
             return_document=ReturnDocument.AFTER,
         )
 
-    async def find_stalled_jobs(self, threshold_minutes: int = 30) -> List[Job]:
+    async def find_stalled_jobs(self, threshold_minutes: int = 30) -> List[JobRow]:
         """
         Find jobs that have been processing for too long.
+        Returns internal JobRow structs rather than full Pydantic
+        models; this is a worker-side path with trusted documents.
         """
-        threshold_time = datetime.now(timezone.utc) - timedelta(minutes=threshold_minutes)
+        threshold_time = datetime.now(_UTC) - timedelta(minutes=threshold_minutes)
         query = {
-            "status": JobStatus.PROCESSING,
+            "status": STATUS_TO_CODE[JobStatus.PROCESSING],
             "started_at": {"$lt": threshold_time},
             "attempts": {"$lt": 3},  # Max retry attempts
         }
-        return await self.list(query=query)
+        # Pin the plan to the PROCESSING-only partial index; the status
+        # equality in the query guarantees it is applicable.
+        docs = await self.collection.find(query).hint("proc_started").to_list(None)
+        return [_row_from_doc(doc) for doc in docs]
 
     async def cleanup_old_jobs(self, days: int = 30) -> int:
         """
         Delete jobs older than specified days.
+        Runs in bounded batches (see CLEANUP_BATCH_SIZE) so lock hold
+        time and oplog growth stay flat regardless of backlog size.
         """
-        threshold_date = datetime.now(timezone.utc) - timedelta(days=days)
-        result = await self.collection.delete_many(
-            {
-                "created_at": {"$lt": threshold_date},
-                "status": {"$in": [JobStatus.COMPLETED, JobStatus.FAILED]},
-            }
-        )
-        logger.info(
-            "Cleaned up old jobs",
-            extra={"deleted_count": result.deleted_count, "threshold_days": days},
-        )
-        return result.deleted_count
+        threshold_date = datetime.now(_UTC) - timedelta(days=days)
+        query = {
+            "created_at": {"$lt": threshold_date},
+            "status": {
+                "$in": [
+                    STATUS_TO_CODE[JobStatus.COMPLETED],
+                    STATUS_TO_CODE[JobStatus.FAILED],
+                ]
+            },
+        }
+        total_deleted = 0
+        while True:
+            docs = await (
+                self.collection.find(
+                    query, projection={"_id": 1, "user_id": 1, "status": 1}
+                )
+                .sort("created_at", 1)
+                .limit(CLEANUP_BATCH_SIZE)
+                .to_list(length=CLEANUP_BATCH_SIZE)
+            )
+            if not docs:
+                break
+            result = await self.collection.delete_many(
+                {"_id": {"$in": [doc["_id"] for doc in docs]}}
+            )
+            total_deleted += result.deleted_count
+            # Keep the live counters in sync, one decrement per
+            # (user, status) bucket touched by this batch.
+            buckets: Dict[Tuple[str, str], int] = {}
+            for doc in docs:
+                key = (doc["user_id"], _status_bucket(doc.get("status")))
+                buckets[key] = buckets.get(key, 0) + 1
+            for (user_id, bucket), count in buckets.items():
+                await self._bump_status_counter(user_id, bucket, -count)
+            # Yield between batches so cleanup never monopolizes the
+            # event loop or the storage engine.
+            await asyncio.sleep(0.01)
+        if total_deleted:
+            await self._invalidate_stats_cache(None)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Cleaned up old jobs",
+                extra={"deleted_count": total_deleted, "threshold_days": days},
+            )
+        return total_deleted
 
     async def get_job_stats(self, user_id: Optional[str] = None) -> Dict[str, int]:
         """
         Get job statistics, optionally filtered by user.
+        The non-empty status match lets the planner pick the compound
+        index, and projecting down to status keeps full documents out of
+        the group stage.
+
+        Reads come from the live job_counters collection — at most one
+        tiny document per (user, status) — with the aggregation kept as
+        a fallback for data written before the counters existed.
+
+        Results are served from a short-TTL Redis entry when available,
+        treating the counters as a materialized view that writes
+        invalidate; repeat dashboard loads become a single Redis GET.
         """
-        match_stage = {"$match": {}} if user_id is None else {"$match": {"user_id": user_id}}
+        cache_key = f"job_stats:{user_id or 'all'}"
+        client = RedisCache.client
+        if client:
+            try:
+                cached = await client.get(cache_key)
+                if cached is not None:
+                    return orjson.loads(cached)
+            except Exception:
+                pass
+
+        counter_query = {"_id.user_id": user_id} if user_id else {}
+        counter_docs = await self.counters.find(counter_query).to_list(None)
+        if counter_docs:
+            stats: Dict[str, int] = {}
+            for doc in counter_docs:
+                bucket = doc["_id"]["status"]
+                stats[bucket] = stats.get(bucket, 0) + doc["count"]
+            if client:
+                try:
+                    await client.setex(
+                        cache_key, STATS_CACHE_TTL_SECONDS, orjson.dumps(stats)
+                    )
+                except Exception:
+                    pass
+            return stats
+
+        match: Dict[str, Any] = {"status": {"$in": list(CODE_TO_STATUS)}}
+        if user_id is not None:
+            match["user_id"] = user_id
         pipeline = [
-            match_stage,
+            {"$match": match},
+            {"$project": {"status": 1, "_id": 0}},
             {"$group": {"_id": "$status", "count": {"$sum": 1}}},
         ]
-        result = await self.collection.aggregate(pipeline).to_list(None)
-        return {doc["_id"]: doc["count"] for doc in result}
\ No newline at end of file
+        result = await self.collection.aggregate(
+            pipeline, allowDiskUse=False
+        ).to_list(None)
+        stats = {_status_bucket(doc["_id"]): doc["count"] for doc in result}
+
+        if client:
+            try:
+                await client.setex(
+                    cache_key, STATS_CACHE_TTL_SECONDS, orjson.dumps(stats)
+                )
+            except Exception:
+                pass
+        return stats
+
+    async def _invalidate_stats_cache(self, user_id: Optional[str]) -> None:
+        """
+        Drop the cached stats for a user (and the global rollup) after a
+        write that changes status distribution. Best effort only.
+        """
+        client = RedisCache.client
+        if not client:
+            return
+        try:
+            if user_id:
+                await client.delete(f"job_stats:{user_id}", "job_stats:all")
+            else:
+                await client.delete("job_stats:all")
+        except Exception:
+            pass
\ No newline at end of file
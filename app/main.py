@@ -1,10 +1,12 @@
+import functools
 import logging
+import re
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.exceptions import HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.api.routes import router as api_router
 from app.core.config import settings
@@ -13,20 +15,73 @@ from app.core.exceptions import (
     validation_exception_handler,
     custom_exception_handler,
 )
-from app.core.middleware import error_handler_middleware, logging_middleware
-from app.db.mongodb import connect_to_mongo, close_mongo_connection
-from app.utils.logging import setup_logging
+from app.core.middleware import ErrorHandlerMiddleware, LoggingMiddleware
+from app.db.mongodb import MongoDB, connect_to_mongo, close_mongo_connection
+from app.db.redis import connect_to_redis, close_redis_connection
+from app.db.repositories.jobs import JobRepository
+from app.services.job_service import (
+    start_completion_batcher,
+    start_schedule_workers,
+    stop_completion_batcher,
+    stop_schedule_workers,
+)
+from app.utils.logging import setup_logging, shutdown_logging
+
+# Install uvloop as the event-loop policy when available, so every
+# entrypoint gets the C loop — not only the uvicorn.run call below.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # Initialize logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+def _cache_dependency_signatures() -> None:
+    """
+    Memoize FastAPI's callable-signature inspection so repeated
+    inspect.signature walks over the same endpoint/dependency callables
+    (get_current_user, JobService, ...) are resolved once and reused.
+    """
+    from fastapi.dependencies import utils as dependency_utils
+
+    if getattr(dependency_utils.get_typed_signature, "cache_info", None):
+        return  # Already wrapped
+    dependency_utils.get_typed_signature = functools.lru_cache(maxsize=None)(
+        dependency_utils.get_typed_signature
+    )
+
+_cache_dependency_signatures()
+
+def _cors_origin_config() -> dict:
+    """
+    Build the origin arguments for CORSMiddleware. The wildcard (and
+    small explicit lists) keep Starlette's fast membership path; large
+    lists are compiled into a single anchored regex so the per-request
+    origin check is one C-level match instead of a Python list scan.
+    """
+    origins = settings.CORS_ORIGINS
+    if "*" in origins or len(origins) <= 8:
+        return {"allow_origins": origins}
+    pattern = "|".join(re.escape(origin) for origin in origins)
+    return {"allow_origin_regex": f"^(?:{pattern})$"}
+
 async def lifespan(app: FastAPI):
     logger.info("Starting up application...")
     await connect_to_mongo()
+    await connect_to_redis()
+    await JobRepository(MongoDB.get_db()).ensure_indexes()
+    start_schedule_workers()
+    start_completion_batcher()
     yield
     logger.info("Shutting down application...")
+    await stop_schedule_workers()
+    await stop_completion_batcher()
     await close_mongo_connection()
+    await close_redis_connection()
+    shutdown_logging()
 
 def create_application() -> FastAPI:
     """
@@ -39,21 +94,22 @@ def create_application() -> FastAPI:
         version=settings.VERSION,
         docs_url="/docs" if settings.SHOW_DOCS else None,
         redoc_url="/redoc" if settings.SHOW_DOCS else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        **_cors_origin_config(),
     )
 
-    # Add custom middleware
-    app.add_middleware(BaseHTTPMiddleware, dispatch=error_handler_middleware)
-    app.add_middleware(BaseHTTPMiddleware, dispatch=logging_middleware)
+    # Add custom middleware (pure ASGI, no BaseHTTPMiddleware wrapper)
+    app.add_middleware(ErrorHandlerMiddleware)
+    app.add_middleware(LoggingMiddleware)
 
     # Register exception handlers
     app.add_exception_handler(HTTPException, http_exception_handler)
@@ -62,6 +118,11 @@ def create_application() -> FastAPI:
 
     # Include API routes
     app.include_router(api_router, prefix="/api/v1")
+
+    # Build the OpenAPI schema eagerly (it is cached on the app) so the
+    # first /docs or /openapi.json request doesn't pay for generation.
+    if settings.SHOW_DOCS:
+        app.openapi()
     return app
 
 app = create_application()
@@ -74,5 +135,12 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        workers=settings.WORKERS,
+        # C-accelerated event loop and HTTP parser.
+        loop="uvloop",
+        http="httptools",
+        # Request logging is already handled by LoggingMiddleware; the
+        # uvicorn access log would duplicate it per request.
+        access_log=False,
         log_level=settings.LOG_LEVEL.lower(),
     )
\ No newline at end of file
@@ -7,11 +7,6 @@ class TimestampModel(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
-
 class MongoModel(TimestampModel):
     """Base model for MongoDB documents."""
     id: Optional[str] = Field(None, alias="_id")
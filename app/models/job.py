@@ -1,6 +1,7 @@
 from enum import Enum
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, field_validator
+import msgspec
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from datetime import datetime, timezone
 from app.models.base import MongoModel
 
@@ -13,6 +14,22 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# MongoDB stores status as a small int code instead of the 9-10 byte
+# string: index entries shrink ~5x and key comparisons get cheaper. The
+# API keeps the string form; encoding/decoding happens at the repository
+# boundary.
+STATUS_TO_CODE: Dict[JobStatus, int] = {
+    JobStatus.QUEUED: 0,
+    JobStatus.PROCESSING: 1,
+    JobStatus.COMPLETED: 2,
+    JobStatus.FAILED: 3,
+    JobStatus.CANCELLED: 4,
+}
+CODE_TO_STATUS: Dict[int, JobStatus] = {
+    code: status for status, code in STATUS_TO_CODE.items()
+}
+
+
 class JobCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
@@ -49,6 +66,13 @@ class Job(MongoModel):
     completed_at: Optional[datetime] = None
     attempts: int = Field(default=0, ge=0)
 
+    @field_validator("status", mode="before")
+    def decode_status(cls, value: Any) -> Any:
+        # Accept the storage int code alongside the string form.
+        if isinstance(value, int):
+            return CODE_TO_STATUS.get(value, value)
+        return value
+
     class Config:
         schema_extra = {
             "example": {
@@ -75,6 +99,19 @@ class JobResponse(BaseModel):
     result: Optional[Dict[str, Any]]
     error: Optional[str]
 
+    @field_validator("id", mode="before")
+    def stringify_id(cls, value: Any) -> Any:
+        # MongoDB hands back ObjectId instances; the API exposes ids as strings.
+        return str(value) if value is not None else value
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Serialize with null fields dropped by default; most optional job
+        fields are unset and only cost bytes on the wire.
+        """
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump(**kwargs)
+
     class Config:
         orm_mode = True
 
@@ -84,6 +121,8 @@ class JobList(BaseModel):
     total: int
     skip: int
     limit: int
+    # Opaque keyset-pagination cursor; present when another page exists.
+    next_cursor: Optional[str] = None
 
     class Config:
         schema_extra = {
@@ -107,4 +146,34 @@ class JobList(BaseModel):
                 "skip": 0,
                 "limit": 10
             }
-        }
\ No newline at end of file
+        }
+
+
+class JobRow(msgspec.Struct, gc=False):
+    """
+    Slim internal DTO for repository/worker paths where documents are
+    trusted (validated on write): construction is several times cheaper
+    than a Pydantic model and the instances are GC-exempt. Convert to
+    JobResponse only at the HTTP boundary.
+    """
+
+    id: str
+    user_id: str
+    title: str
+    status: JobStatus
+    priority: int
+    created_at: datetime
+    updated_at: datetime
+    description: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+
+# Module-level adapters built once at import time; they reuse the
+# compiled pydantic-core schema instead of re-resolving it per call, and
+# the list adapter validates a whole page in a single pass.
+JOB_RESPONSE_ADAPTER = TypeAdapter(JobResponse)
+JOB_RESPONSE_LIST_ADAPTER = TypeAdapter(List[JobResponse])
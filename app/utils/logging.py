@@ -1,8 +1,12 @@
 import logging
+import logging.handlers
 import json
+import queue
 import sys
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+import orjson
 from pythonjsonlogger import jsonlogger
 from contextvars import ContextVar
 from app.core.config import settings
@@ -12,29 +16,69 @@ request_id: ContextVar[str] = ContextVar('request_id', default='')
 user_id: ContextVar[str] = ContextVar('user_id', default='')
 
 
+# Formatted-timestamp cache: all records within the same wall-clock
+# second reuse one base ISO string, so only the millisecond suffix is
+# computed per record.
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _iso_timestamp() -> str:
+    global _ts_cache
+    now = time.time()
+    sec = int(now)
+    cached_sec, base = _ts_cache
+    if sec != cached_sec:
+        # Drop the "+00:00" suffix; the Z plus milliseconds go back on
+        # per record below.
+        base = datetime.fromtimestamp(sec, timezone.utc).isoformat()[:-6]
+        _ts_cache = (sec, base)
+    return "%s.%03dZ" % (base, int((now - sec) * 1000))
+
+
+def _json_serializer(log_record: Dict[str, Any], default=None, **_kwargs) -> str:
+    """
+    orjson-backed serializer for jsonlogger: C-level encoding with
+    native datetime support, replacing the stdlib json.dumps pass every
+    log line otherwise pays for.
+    """
+    return orjson.dumps(
+        log_record,
+        default=default,
+        option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC,
+    ).decode()
+
+
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """
     Custom JSON formatter that adds additional fields for structured logging.
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Bound once at construction: pydantic-settings attribute access
+        # is not free and these are read for every record.
+        self._debug = bool(settings.DEBUG)
+        self._min_level = logging.getLevelName(settings.LOG_LEVEL)
+
+    def format(self, record: logging.LogRecord) -> str:
+        # Records below the configured level can still reach the handler
+        # via permissive third-party loggers; skip the JSON pass for
+        # them entirely.
+        if record.levelno < self._min_level:
+            return ""
+        return super().format(record)
+
     def add_fields(
         self, log_record: Dict[str, Any], record: logging.LogRecord, message_dict: Dict[str, Any]
     ) -> None:
         super().add_fields(log_record, record, message_dict)
-        # Add timestamp with timezone awareness
-        log_record['timestamp'] = datetime.now(timezone.utc).isoformat()
-        log_record['level'] = record.levelname
-        log_record['environment'] = settings.ENVIRONMENT
-
-        # Add context variables if they exist
-        req_id = request_id.get()
-        if req_id:
-            log_record['request_id'] = req_id
-        usr_id = user_id.get()
-        if usr_id:
-            log_record['user_id'] = usr_id
+        # Per-second cached ISO timestamp with a millisecond suffix;
+        # avoids a datetime allocation and format call per record.
+        # level and environment are handled by rename_fields /
+        # static_fields in the base class, not here.
+        log_record['timestamp'] = _iso_timestamp()
 
         # Add caller information in development mode
-        if settings.DEBUG:
+        if self._debug:
             log_record['function'] = record.funcName
             log_record['module'] = record.module
             log_record['line'] = record.lineno
@@ -46,20 +90,42 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
 
 class RequestIdFilter(logging.Filter):
     """
-    Logging filter that injects the current request ID into log records.
+    Logging filter that stamps the request context (request ID and user
+    ID) onto log records, once per record; the formatter picks the
+    fields up from the format string.
+
+    Must be attached on the producing side of the log queue (the
+    QueueHandler): the ContextVars only carry request state on the
+    event-loop thread, not in the listener thread.
     """
+    def __init__(self, name: str = "") -> None:
+        super().__init__(name)
+        # Bound methods avoid the module-global lookups per record.
+        self._get_request_id = request_id.get
+        self._get_user_id = user_id.get
+
     def filter(self, record: logging.LogRecord) -> bool:
-        record.request_id = request_id.get()
+        record.request_id = self._get_request_id()
+        record.user_id = self._get_user_id()
         return True
 
 
+# Listener that drains the log queue in a background thread; kept at
+# module scope so shutdown_logging can stop it cleanly.
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging() -> None:
     """
     Configure and setup the application's logging:
     - Uses a JSON formatter for structured logging.
     - Removes any pre-existing logging handlers.
+    - Routes records through a queue so formatting and the stdout write
+      happen in a background thread, off the event loop.
     - Sets log levels for core and third-party loggers.
     """
+    global _queue_listener
+
     # Create the root logger and set its level
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.LOG_LEVEL)
@@ -71,14 +137,36 @@ def setup_logging() -> None:
     # Create a console handler and assign our custom JSON formatter
     console_handler = logging.StreamHandler(sys.stdout)
     formatter = CustomJsonFormatter(
-        fmt='%(timestamp)s %(levelname)s %(name)s %(message)s',
-        json_ensure_ascii=False
+        fmt='%(timestamp)s %(levelname)s %(name)s %(request_id)s %(user_id)s %(message)s',
+        rename_fields={'levelname': 'level'},
+        static_fields={'environment': settings.ENVIRONMENT},
+        json_serializer=_json_serializer
     )
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(RequestIdFilter())
-
-    # Add the console handler to the root logger
-    root_logger.addHandler(console_handler)
+    console_handler.setLevel(settings.LOG_LEVEL)
+
+    # Skip thread/process introspection when records are created; each
+    # record otherwise pays for a current_thread() and os.getpid() call.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # The event loop only enqueues records; the listener thread does the
+    # actual formatting and I/O. The context filter sits on the queue
+    # handler, not the console handler: the ContextVars must be read on
+    # the event-loop thread, before records cross into the listener
+    # thread where they would always resolve to the defaults.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    root_logger.addHandler(queue_handler)
+
+    if _queue_listener:
+        _queue_listener.stop()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     # Set third-party loggers to WARNING to reduce verbosity
     logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
@@ -89,6 +177,17 @@ def setup_logging() -> None:
     app_logger.setLevel(settings.LOG_LEVEL)
 
 
+def shutdown_logging() -> None:
+    """
+    Stop the queue listener, flushing any pending records.
+    Called during application shutdown.
+    """
+    global _queue_listener
+    if _queue_listener:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Retrieve a named logger under the 'app' namespace.
@@ -96,41 +195,45 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(f"app.{name}")
 
 
+# Name -> ContextVar dispatch for LoggerContext: one hash lookup per
+# key instead of a branch chain.
+_CTX_VARS = {'request_id': request_id, 'user_id': user_id}
+
+
 class LoggerContext:
     """
     Context manager for temporarily setting log context variables.
+    Unknown keys are ignored, matching the old branch-based behaviour.
     """
     def __init__(self, **kwargs):
         self.context = kwargs
-        self.tokens = {}
+        self.tokens = []
 
     def __enter__(self):
         for key, value in self.context.items():
-            if key == 'request_id':
-                self.tokens[key] = request_id.set(value)
-            elif key == 'user_id':
-                self.tokens[key] = user_id.set(value)
+            var = _CTX_VARS.get(key)
+            if var is not None:
+                self.tokens.append((var, var.set(value)))
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        for key, token in self.tokens.items():
-            if key == 'request_id':
-                request_id.reset(token)
-            elif key == 'user_id':
-                user_id.reset(token)
+        for var, token in self.tokens:
+            var.reset(token)
 
 
 def log_error(logger: logging.Logger, error: Exception, context: Dict[str, Any] = None) -> None:
     """
-    Log an error with context using a structured JSON format.
+    Log an error with its type and context.
+    Uses lazy %-formatting and no extra= merging: the message is only
+    rendered when a handler accepts the record, and nothing is copied
+    into the record's __dict__ per call.
     """
-    error_data = {
-        'error_type': type(error).__name__,
-        'error_message': str(error),
-        'context': context or {}
-    }
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     logger.error(
-        f"Error occurred: {error_data['error_type']}",
-        extra={'error_details': error_data, 'stack_trace': True},
-        exc_info=error
+        "Error occurred: %s: %s (context=%s)",
+        type(error).__name__,
+        error,
+        context or {},
+        exc_info=error,
     )
\ No newline at end of file